@@ -1,10 +1,13 @@
+import asyncio
 import os
 import httpx
-import json
+import orjson
+from cachetools import TTLCache
 import logging
 import re
-from typing import Dict, Any, Optional, List, Union
-from urllib.parse import urlencode
+import sys
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, Union, AsyncIterator
 from mcp.server.fastmcp import FastMCP, Context
 from dotenv import load_dotenv
 
@@ -26,45 +29,131 @@ class Config:
     }
     HARVEST_ACCOUNT_ID = os.environ.get("HARVEST_ACCOUNT_ID")
     HARVEST_TOKEN = os.environ.get("HARVEST_TOKEN")
+    CACHE_TTL = int(os.environ.get("HARVEST_CACHE_TTL", 60))
+    CACHE_MAXSIZE = 256
+    BULK_CONCURRENCY = 8
+    MAX_CONCURRENT_REQUESTS = 16
+    MAX_ERROR_BODY = 4096
+
+_EP_USERS_ME = "users/me"
+_EP_TIME_ENTRIES = "time_entries"
+_EP_PROJECTS = "projects"
+_EP_TASKS = "tasks"
+
+_RE_BEARER = re.compile(r'(Bearer\s+)[^\s"]+')
+_RE_AUTH = re.compile(r'(Authorization["\s]*:)[^,}\n]+')
+_RE_TOKEN = re.compile(r'(token|TOKEN|Token)["\s]*:?["\s]*[^,}\s"]+')
 
 def mask_sensitive_data(text: str) -> str:
     """Mask sensitive data like tokens and credentials in strings."""
     if not text:
         return text
 
-    text = re.sub(r'(Bearer\s+)[^\s"]+', r'\1[REDACTED]', text)
-    text = re.sub(r'(Authorization["\s]*:)[^,}\n]+', r'\1 [REDACTED]', text)
-    text = re.sub(r'(token|TOKEN|Token)["\s]*:?["\s]*[^,}\s"]+', r'\1: [REDACTED]', text)
+    text = _RE_BEARER.sub(r'\1[REDACTED]', text)
+    text = _RE_AUTH.sub(r'\1 [REDACTED]', text)
+    text = _RE_TOKEN.sub(r'\1: [REDACTED]', text)
 
     return text
 
-def build_query_string(params: Dict[str, Any]) -> str:
-    """Build a URL query string from a dictionary of parameters.
+def _compact(**fields: Any) -> Dict[str, Any]:
+    """Return the given fields with None values dropped."""
+    return {k: v for k, v in fields.items() if v is not None}
 
-    Args:
-        params: Dictionary of query parameters
+logger.info("Checking required environment variables...")
+logger.info("HARVEST_ACCOUNT_ID is %s", 'set' if Config.HARVEST_ACCOUNT_ID else 'NOT SET')
+logger.info("HARVEST_TOKEN is %s", 'set' if Config.HARVEST_TOKEN else 'NOT SET')
 
-    Returns:
-        A URL-encoded query string
-    """
-    filtered_params = {k: v for k, v in params.items() if v is not None}
+if not Config.HARVEST_ACCOUNT_ID or not Config.HARVEST_TOKEN:
+    raise RuntimeError("HARVEST_ACCOUNT_ID and HARVEST_TOKEN environment variables must be set")
 
-    for key, value in filtered_params.items():
-        if isinstance(value, bool):
-            filtered_params[key] = str(value).lower()
+_AUTH_HEADERS = {
+    **Config.DEFAULT_HEADERS,
+    "Harvest-Account-ID": Config.HARVEST_ACCOUNT_ID,
+    "Authorization": f"Bearer {Config.HARVEST_TOKEN}"
+}
 
-    if not filtered_params:
-        return ""
+_client: Optional[httpx.AsyncClient] = None
 
-    return urlencode(filtered_params)
+# Caps outbound requests across all tool calls to stay under Harvest's rate limits.
+_outbound_sem = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
 
-logger.info("Checking required environment variables...")
-logger.info(f"HARVEST_ACCOUNT_ID is {'set' if Config.HARVEST_ACCOUNT_ID else 'NOT SET'}")
-logger.info(f"HARVEST_TOKEN is {'set' if Config.HARVEST_TOKEN else 'NOT SET'}")
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to the Harvest API alive across tool
+    calls instead of paying for DNS, TCP and TLS setup on every request. HTTP/2
+    lets concurrent requests share a single multiplexed connection.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=Config.BASE_URL,
+            http2=True,
+            headers=_AUTH_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=httpx.Timeout(connect=3.0, read=15.0, write=5.0, pool=5.0),
+        )
+    return _client
+
+async def _close_client() -> None:
+    """Close the shared HTTP client if it has been created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+_active_sessions = 0
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled connections once the last session has ended.
+
+    FastMCP enters the lifespan once per session, so over SSE several sessions
+    share the client; it is only closed when none of them are still running.
+    """
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await _close_client()
+
+# Raw response bodies for GETs on rarely changing resources, keyed by
+# (endpoint, sorted params). Bodies are stored as bytes so every hit decodes a
+# fresh object that callers are free to mutate.
+_CACHEABLE_RESOURCES = frozenset({"users", "projects", "tasks"})
+_cache: TTLCache = TTLCache(maxsize=Config.CACHE_MAXSIZE, ttl=Config.CACHE_TTL)
+
+# GET requests currently in flight, keyed like the cache, so concurrent
+# identical calls await one shared request.
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Bumped whenever cached or in-flight data is invalidated. A GET only stores
+# its body in the cache if no invalidation happened while it was in flight.
+_cache_generation = 0
+
+def _invalidate_cache(endpoint: str) -> None:
+    """Forget cached and in-flight GETs for the resource that endpoint belongs to.
+
+    Detaching in-flight GETs means a read issued after a write never joins a
+    request that started before it. None of the current tools write to a
+    cacheable resource, so the cache half is future-proofing for when users,
+    projects or tasks gain write tools.
+    """
+    global _cache_generation
+    _cache_generation += 1
+    resource = endpoint.split("/", 1)[0]
+    for key in [k for k in _cache.keys() if k[0].split("/", 1)[0] == resource]:
+        _cache.pop(key, None)
+    for key in [k for k in _inflight if k[0].split("/", 1)[0] == resource]:
+        del _inflight[key]
 
 mcp = FastMCP(
     "Harvest Time Tracker",
-    description="MCP server for interacting with Harvest time tracking API"
+    description="MCP server for interacting with Harvest time tracking API",
+    lifespan=lifespan
 )
 
 class HarvestAPIError(Exception):
@@ -73,70 +162,136 @@ class HarvestAPIError(Exception):
         self.status_code = status_code
         self.message = message
         self.endpoint = endpoint
-        super().__init__(f"Harvest API error: {status_code} - {message}")
+        super().__init__(status_code, message, endpoint)
+
+    def __str__(self) -> str:
+        return f"Harvest API error: {self.status_code} - {self.message}"
+
+def _error_result(exc: BaseException) -> Dict[str, Any]:
+    """Convert an exception from a batched call into a JSON-serializable result."""
+    if isinstance(exc, HarvestAPIError):
+        return {"error": str(exc), "status_code": exc.status_code, "endpoint": exc.endpoint}
+    return {"error": str(exc)}
+
+async def _send_request(
+        endpoint: str,
+        method: str,
+        params: Dict[str, Any],
+        content: Optional[bytes],
+) -> bytes:
+    """Send a single request on the shared client and return the raw response body.
+
+    Raises:
+        HarvestAPIError: If the API returns an error response or the request fails
+    """
+    logger.info("Making %s request to %s", method, endpoint)
+
+    client = await _get_client()
+
+    try:
+        async with _outbound_sem:
+            response = await client.request(method, endpoint, params=params, content=content)
+
+        if response.status_code >= 400:
+            body = response.content[:Config.MAX_ERROR_BODY].decode("utf-8", "replace")
+            logger.error("Request to %s failed with status %s: %s",
+                         endpoint, response.status_code, mask_sensitive_data(body))
+            if logger.isEnabledFor(logging.DEBUG):
+                safe_headers = {k: '[REDACTED]' if k.lower() in ['authorization', 'harvest-account-id'] else v
+                               for k, v in _AUTH_HEADERS.items()}
+                logger.debug("Request headers (sanitized): %s", safe_headers)
+
+            raise HarvestAPIError(response.status_code, body, endpoint)
+    except httpx.TimeoutException as e:
+        logger.error("Request to %s timed out: %s", endpoint, e)
+        raise HarvestAPIError(0, "Request timed out", endpoint)
+    except httpx.RequestError as e:
+        logger.error("Request error for %s: %s", endpoint, e)
+        raise HarvestAPIError(0, f"Connection error: {str(e)}", endpoint)
+
+    return response.content
+
+async def _fetch_shared(
+        key: tuple,
+        endpoint: str,
+        params: Dict[str, Any],
+        cacheable: bool,
+) -> bytes:
+    """Run a shared GET and cache its body unless it was invalidated meanwhile."""
+    generation = _cache_generation
+    body = await _send_request(endpoint, "GET", params, None)
+    if cacheable and generation == _cache_generation:
+        _cache[key] = body
+    return body
 
 async def harvest_request(
         endpoint: str,
         method: str = "GET",
         data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Make an authenticated request to the Harvest API.
 
+    Concurrent identical GETs share a single in-flight request, and GETs on
+    cacheable resources are served from the response cache while fresh.
+
     Args:
         endpoint: The API endpoint to call
         method: HTTP method (GET, POST, PATCH, DELETE)
         data: Optional data to send with the request
+        params: Optional query parameters; None values are dropped and booleans
+                are sent as "true"/"false"
 
     Returns:
         The JSON response from the API
 
     Raises:
-        ValueError: If required environment variables are missing or method is invalid
         HarvestAPIError: If the API returns an error response
     """
-    account_id = Config.HARVEST_ACCOUNT_ID
-    token = Config.HARVEST_TOKEN
-
-    if not account_id or not token:
-        raise ValueError("HARVEST_ACCOUNT_ID and HARVEST_TOKEN environment variables must be set")
+    method = method.upper()
+    params = {k: (str(v).lower() if isinstance(v, bool) else v)
+              for k, v in (params or {}).items() if v is not None}
 
-    headers = {
-        **Config.DEFAULT_HEADERS,
-        "Harvest-Account-ID": account_id,
-        "Authorization": f"Bearer {token}"
-    }
-
-    url = f"{Config.BASE_URL}/{endpoint}"
-
-    logger.info(f"Making {method} request to {url}")
-
-    async with httpx.AsyncClient() as client:
+    if method != "GET":
+        content = orjson.dumps(data) if data is not None else None
         try:
-            if method == "GET":
-                response = await client.get(url, headers=headers)
-            elif method == "POST":
-                response = await client.post(url, headers=headers, json=data)
-            elif method == "PATCH":
-                response = await client.patch(url, headers=headers, json=data)
-            elif method == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            if response.status_code >= 400:
-                error_message = f"Harvest API error: {response.status_code} - {response.text}"
-                safe_headers = {k: '[REDACTED]' if k.lower() in ['authorization', 'harvest-account-id'] else v
-                               for k, v in headers.items()}
-
-                logger.error(f"Request to {url} failed with status {response.status_code}")
-                logger.error(f"Request headers (sanitized): {safe_headers}")
-
-                raise HarvestAPIError(response.status_code, response.text, endpoint)
-
-            return response.json()
-        except httpx.RequestError as e:
-            logger.error(f"Request error for {url}: {str(e)}")
-            raise HarvestAPIError(0, f"Connection error: {str(e)}", endpoint)
+            body = await _send_request(endpoint, method, params, content)
+        finally:
+            # Invalidate even on failure: the write may still have been applied.
+            _invalidate_cache(endpoint)
+        return orjson.loads(body)
+
+    key = (endpoint, tuple(sorted(params.items())))
+    cacheable = endpoint.split("/", 1)[0] in _CACHEABLE_RESOURCES
+    if cacheable:
+        cached = _cache.get(key)
+        if cached is not None:
+            logger.debug("Cache hit for %s", endpoint)
+            return orjson.loads(cached)
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_shared(key, endpoint, params, cacheable))
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Future) -> None:
+            # Mark the exception as retrieved so asyncio doesn't log it when
+            # every caller waiting on the shared request was cancelled.
+            if not done.cancelled():
+                done.exception()
+            # The entry may already have been detached and replaced by a newer request.
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+    else:
+        logger.debug("Joining in-flight request for %s", endpoint)
+
+    # Shield the shared request so one caller being cancelled does not fail
+    # the others waiting on it.
+    body = await asyncio.shield(task)
+
+    return orjson.loads(body)
 
 
 @mcp.tool()
@@ -146,8 +301,8 @@ async def get_current_user() -> Dict[str, Any]:
     Returns detailed information about the authenticated Harvest user,
     including name, email, role, and other account details.
     """
-    user_data = await harvest_request("users/me")
-    logger.info(f"Retrieved user data for {user_data.get('first_name')} {user_data.get('last_name')}")
+    user_data = await harvest_request(_EP_USERS_ME)
+    logger.info("Retrieved user data for %s %s", user_data.get('first_name'), user_data.get('last_name'))
     return user_data
 
 
@@ -165,19 +320,14 @@ async def list_time_entries(from_date: str = None, to_date: str = None) -> Dict[
     Raises:
         HarvestAPIError: If the API returns an error response
     """
-    params = {}
-    if from_date:
-        params["from"] = from_date
-    if to_date:
-        params["to"] = to_date
-
-    endpoint = "time_entries"
-    query_string = build_query_string(params)
-    if query_string:
-        endpoint = f"{endpoint}?{query_string}"
-
-    time_entries = await harvest_request(endpoint)
-    logger.info(f"Retrieved {len(time_entries.get('time_entries', []))} time entries")
+    params = {
+        "from": from_date or None,
+        "to": to_date or None
+    }
+
+    time_entries = await harvest_request(_EP_TIME_ENTRIES, params=params)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Retrieved %d time entries", len(time_entries.get('time_entries') or ()))
     return time_entries
 
 
@@ -194,9 +344,9 @@ async def get_time_entry(time_entry_id: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the time entry details
     """
-    endpoint = f"time_entries/{time_entry_id}"
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}"
     time_entry = await harvest_request(endpoint)
-    logger.info(f"Retrieved time entry {time_entry_id}")
+    logger.info("Retrieved time entry %s", time_entry_id)
     return time_entry
 
 
@@ -235,26 +385,50 @@ async def create_time_entry(
     Returns:
         A dictionary containing the created time entry details
     """
-    data = {
-        "project_id": project_id,
-        "task_id": task_id,
-        "spent_date": spent_date
-    }
-
-    if user_id is not None:
-        data["user_id"] = user_id
-    if hours is not None:
-        data["hours"] = hours
-    if notes is not None:
-        data["notes"] = notes
-    if external_reference is not None:
-        data["external_reference"] = external_reference
-
-    time_entry = await harvest_request("time_entries", method="POST", data=data)
-    logger.info(f"Created time entry for project {project_id}, task {task_id} on {spent_date}")
+    data = _compact(
+        project_id=project_id,
+        task_id=task_id,
+        spent_date=spent_date,
+        user_id=user_id,
+        hours=hours,
+        notes=notes,
+        external_reference=external_reference
+    )
+
+    time_entry = await harvest_request(_EP_TIME_ENTRIES, method="POST", data=data)
+    logger.info("Created time entry for project %s, task %s on %s", project_id, task_id, spent_date)
     return time_entry
 
 
+@mcp.tool()
+async def create_time_entries_bulk(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several time entries via duration in one call.
+
+    Each entry accepts the same fields as create_time_entry (project_id, task_id,
+    spent_date, and optionally user_id, hours, notes, external_reference). The
+    entries are created concurrently, with a small cap on parallel requests to
+    stay within Harvest's rate limits.
+
+    Args:
+        entries: A list of time entry objects to create.
+
+    Returns:
+        A list with one result per entry, in the same order. Each result is either
+        the created time entry or an object with an "error" describing why that
+        entry could not be created.
+    """
+    sem = asyncio.Semaphore(Config.BULK_CONCURRENCY)
+
+    async def _create(entry: Dict[str, Any]) -> Dict[str, Any]:
+        async with sem:
+            return await create_time_entry(**entry)
+
+    results = await asyncio.gather(*[_create(entry) for entry in entries], return_exceptions=True)
+    failed = sum(isinstance(result, BaseException) for result in results)
+    logger.info("Created %d of %d time entries", len(results) - failed, len(results))
+    return [_error_result(result) if isinstance(result, BaseException) else result for result in results]
+
+
 @mcp.tool()
 async def update_time_entry(
     time_entry_id: str,
@@ -290,30 +464,21 @@ async def update_time_entry(
     Returns:
         A dictionary containing the updated time entry details
     """
-    data = {}
-
-    if project_id is not None:
-        data["project_id"] = project_id
-    if task_id is not None:
-        data["task_id"] = task_id
-    if spent_date is not None:
-        data["spent_date"] = spent_date
-    if started_time is not None:
-        data["started_time"] = started_time
-    if ended_time is not None:
-        data["ended_time"] = ended_time
-    if hours is not None:
-        data["hours"] = hours
-    if notes is not None:
-        data["notes"] = notes
-    if external_reference is not None:
-        data["external_reference"] = external_reference
-    if is_running is not None:
-        data["is_running"] = is_running
-
-    endpoint = f"time_entries/{time_entry_id}"
+    data = _compact(
+        project_id=project_id,
+        task_id=task_id,
+        spent_date=spent_date,
+        started_time=started_time,
+        ended_time=ended_time,
+        hours=hours,
+        notes=notes,
+        external_reference=external_reference,
+        is_running=is_running
+    )
+
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}"
     time_entry = await harvest_request(endpoint, method="PATCH", data=data)
-    logger.info(f"Updated time entry {time_entry_id}")
+    logger.info("Updated time entry %s", time_entry_id)
     return time_entry
 
 
@@ -331,9 +496,9 @@ async def delete_time_entry(time_entry_id: str) -> Dict[str, Any]:
     Returns:
         An empty dictionary if successful
     """
-    endpoint = f"time_entries/{time_entry_id}"
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}"
     result = await harvest_request(endpoint, method="DELETE")
-    logger.info(f"Deleted time entry {time_entry_id}")
+    logger.info("Deleted time entry %s", time_entry_id)
     return result
 
 
@@ -372,13 +537,9 @@ async def list_projects(
         "per_page": per_page
     }
 
-    endpoint = "projects"
-    query_string = build_query_string(params)
-    if query_string:
-        endpoint = f"{endpoint}?{query_string}"
-
-    projects = await harvest_request(endpoint)
-    logger.info(f"Retrieved {len(projects.get('projects', []))} projects")
+    projects = await harvest_request(_EP_PROJECTS, params=params)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Retrieved %d projects", len(projects.get('projects') or ()))
     return projects
 
 
@@ -414,16 +575,39 @@ async def list_tasks(
         "per_page": per_page
     }
 
-    endpoint = "tasks"
-    query_string = build_query_string(params)
-    if query_string:
-        endpoint = f"{endpoint}?{query_string}"
-
-    tasks = await harvest_request(endpoint)
-    logger.info(f"Retrieved {len(tasks.get('tasks', []))} tasks")
+    tasks = await harvest_request(_EP_TASKS, params=params)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Retrieved %d tasks", len(tasks.get('tasks') or ()))
     return tasks
 
 
+@mcp.tool()
+async def get_workspace_snapshot() -> Dict[str, Any]:
+    """Get the current user, projects and tasks in one call.
+
+    Useful as a starting point before logging time, since it returns everything
+    needed to pick a project and task.
+
+    Returns:
+        A dictionary with "user", "projects" and "tasks" keys. If one of the
+        lookups fails, its key holds an object with an "error" instead.
+    """
+    # Independent lookups are awaited together with asyncio.gather so the
+    # tool costs one round trip rather than the sum of all three. Composite
+    # tools should follow the same pattern.
+    keys = ("user", "projects", "tasks")
+    results = await asyncio.gather(
+        get_current_user(),
+        list_projects(),
+        list_tasks(),
+        return_exceptions=True
+    )
+    return {
+        key: _error_result(result) if isinstance(result, BaseException) else result
+        for key, result in zip(keys, results)
+    }
+
+
 @mcp.tool()
 async def create_time_entry_via_start_end(
     project_id: int,
@@ -460,25 +644,20 @@ async def create_time_entry_via_start_end(
     Returns:
         A dictionary containing the created time entry details
     """
-    data = {
-        "project_id": project_id,
-        "task_id": task_id,
-        "spent_date": spent_date
-    }
-
-    if user_id is not None:
-        data["user_id"] = user_id
-    if started_time is not None:
-        data["started_time"] = started_time
-    if ended_time is not None:
-        data["ended_time"] = ended_time
-    if notes is not None:
-        data["notes"] = notes
-    if external_reference is not None:
-        data["external_reference"] = external_reference
-
-    time_entry = await harvest_request("time_entries", method="POST", data=data)
-    logger.info(f"Created time entry for project {project_id}, task {task_id} on {spent_date} with start/end time")
+    data = _compact(
+        project_id=project_id,
+        task_id=task_id,
+        spent_date=spent_date,
+        user_id=user_id,
+        started_time=started_time,
+        ended_time=ended_time,
+        notes=notes,
+        external_reference=external_reference
+    )
+
+    time_entry = await harvest_request(_EP_TIME_ENTRIES, method="POST", data=data)
+    logger.info("Created time entry for project %s, task %s on %s with start/end time",
+                project_id, task_id, spent_date)
     return time_entry
 
 
@@ -494,9 +673,9 @@ async def delete_time_entry_external_reference(time_entry_id: str) -> Dict[str,
     Returns:
         An empty dictionary if successful
     """
-    endpoint = f"time_entries/{time_entry_id}/external_reference"
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}/external_reference"
     result = await harvest_request(endpoint, method="DELETE")
-    logger.info(f"Deleted external reference for time entry {time_entry_id}")
+    logger.info("Deleted external reference for time entry %s", time_entry_id)
     return result
 
 
@@ -513,9 +692,9 @@ async def restart_time_entry(time_entry_id: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the restarted time entry details
     """
-    endpoint = f"time_entries/{time_entry_id}/restart"
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}/restart"
     time_entry = await harvest_request(endpoint, method="PATCH")
-    logger.info(f"Restarted time entry {time_entry_id}")
+    logger.info("Restarted time entry %s", time_entry_id)
     return time_entry
 
 
@@ -532,12 +711,41 @@ async def stop_time_entry(time_entry_id: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the stopped time entry details
     """
-    endpoint = f"time_entries/{time_entry_id}/stop"
+    endpoint = f"{_EP_TIME_ENTRIES}/{time_entry_id}/stop"
     time_entry = await harvest_request(endpoint, method="PATCH")
-    logger.info(f"Stopped time entry {time_entry_id}")
+    logger.info("Stopped time entry %s", time_entry_id)
     return time_entry
 
 
+@mcp.tool()
+async def clear_harvest_cache() -> Dict[str, Any]:
+    """Clear cached Harvest API responses.
+
+    The current user, projects and tasks are cached for a short time to avoid
+    repeated API calls. Use this to force the next request to fetch fresh data.
+
+    Returns:
+        A dictionary with the number of cached responses that were cleared
+    """
+    global _cache_generation
+    cleared = len(_cache)
+    _cache_generation += 1
+    _cache.clear()
+    _inflight.clear()
+    logger.info("Cleared %d cached responses", cleared)
+    return {"cleared": cleared}
+
+
 if __name__ == "__main__":
-    logger.info(f"Starting Harvest MCP Server...")
+    # FastMCP starts its loop through anyio.run without a loop factory hook,
+    # so uvloop can only be selected via the event loop policy. Policies are
+    # deprecated from Python 3.14; there the default asyncio loop is used.
+    if sys.version_info < (3, 14):
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
+    logger.info("Starting Harvest MCP Server...")
     mcp.run()
\ No newline at end of file
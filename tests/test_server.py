@@ -0,0 +1,239 @@
+import asyncio
+import gc
+import os
+import sys
+
+import httpx
+import orjson
+import pytest
+
+os.environ.setdefault("HARVEST_ACCOUNT_ID", "1")
+os.environ.setdefault("HARVEST_TOKEN", "test-token")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    server._cache.clear()
+    server._inflight.clear()
+    yield
+    server._cache.clear()
+    server._inflight.clear()
+
+
+def run_with_transport(handler, scenario):
+    """Run scenario() on a fresh event loop with the shared client mocked by handler."""
+    async def main():
+        server._client = httpx.AsyncClient(
+            base_url=server.Config.BASE_URL,
+            headers=server._AUTH_HEADERS,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            return await scenario()
+        finally:
+            await server._close_client()
+
+    return asyncio.run(main())
+
+
+def test_get_after_update_does_not_join_earlier_request():
+    state = {"notes": "old", "gets": 0}
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.method == "PATCH":
+            state["notes"] = orjson.loads(request.content)["notes"]
+            return httpx.Response(200, content=orjson.dumps({"id": 5, "notes": state["notes"]}))
+        notes = state["notes"]
+        state["gets"] += 1
+        if state["gets"] == 1:
+            started.set()
+            await release.wait()
+        return httpx.Response(200, content=orjson.dumps({"id": 5, "notes": notes}))
+
+    async def scenario():
+        slow = asyncio.create_task(server.get_time_entry("5"))
+        await started.wait()
+        await server.update_time_entry("5", notes="new")
+        fresh = await server.get_time_entry("5")
+        release.set()
+        return (await slow), fresh
+
+    stale, fresh = run_with_transport(handler, scenario)
+    assert stale["notes"] == "old"
+    assert fresh["notes"] == "new"
+
+
+def test_clear_cache_discards_in_flight_result():
+    calls = []
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            started.set()
+            await release.wait()
+        return httpx.Response(200, content=orjson.dumps({"projects": [], "version": len(calls)}))
+
+    async def scenario():
+        slow = asyncio.create_task(server.list_projects())
+        await started.wait()
+        await server.clear_harvest_cache()
+        release.set()
+        await slow
+        return await server.list_projects()
+
+    projects = run_with_transport(handler, scenario)
+    assert len(calls) == 2
+    assert projects["version"] == 2
+
+
+def test_failed_shared_get_with_cancelled_caller_is_not_logged():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    unhandled = []
+
+    async def handler(request):
+        started.set()
+        await release.wait()
+        return httpx.Response(503, content=b'{"error":"unavailable"}')
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        caller = asyncio.create_task(server.get_time_entry("1"))
+        await started.wait()
+        shared = server._inflight[("time_entries/1", ())]
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+        await asyncio.wait([shared])
+        del shared
+        gc.collect()
+
+    run_with_transport(handler, scenario)
+    assert unhandled == []
+
+
+def recording_handler(calls, body):
+    async def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, content=orjson.dumps(body))
+
+    return handler
+
+
+def test_cache_hit_for_same_endpoint_and_params():
+    calls = []
+
+    async def scenario():
+        first = await server.list_projects(is_active=True)
+        second = await server.list_projects(is_active=True)
+        return first, second
+
+    first, second = run_with_transport(recording_handler(calls, {"projects": [{"id": 1}]}), scenario)
+    assert len(calls) == 1
+    assert first == second
+
+
+def test_cache_miss_when_params_differ():
+    calls = []
+
+    async def scenario():
+        await server.list_projects(is_active=True)
+        await server.list_projects(is_active=False)
+
+    run_with_transport(recording_handler(calls, {"projects": []}), scenario)
+    assert len(calls) == 2
+    assert calls[0].endswith("is_active=true")
+    assert calls[1].endswith("is_active=false")
+
+
+def test_cache_hits_return_independent_copies():
+    calls = []
+
+    async def scenario():
+        first = await server.list_tasks()
+        first["tasks"].append({"id": 99})
+        second = await server.list_tasks()
+        return second
+
+    second = run_with_transport(recording_handler(calls, {"tasks": [{"id": 1}]}), scenario)
+    assert len(calls) == 1
+    assert second["tasks"] == [{"id": 1}]
+
+
+def test_time_entries_are_not_cached():
+    calls = []
+
+    async def scenario():
+        await server.list_time_entries()
+        await server.list_time_entries()
+        await server.get_time_entry("5")
+        await server.get_time_entry("5")
+
+    run_with_transport(recording_handler(calls, {"time_entries": []}), scenario)
+    assert len(calls) == 4
+    assert len(server._cache) == 0
+
+
+def test_bulk_create_preserves_order_and_reports_failures_in_place():
+    async def handler(request):
+        entry = orjson.loads(request.content)
+        if entry["project_id"] == 422:
+            return httpx.Response(422, content=b'{"message":"invalid project"}')
+        return httpx.Response(201, content=orjson.dumps({"id": entry["project_id"] * 10, **entry}))
+
+    entries = [
+        {"project_id": 1, "task_id": 1, "spent_date": "2026-01-01", "hours": 1.0},
+        {"project_id": 422, "task_id": 1, "spent_date": "2026-01-01"},
+        {"project_id": 3, "task_id": 1, "spent_date": "2026-01-01", "unknown": True},
+        {"project_id": 4, "task_id": 1, "spent_date": "2026-01-01"},
+    ]
+
+    results = run_with_transport(handler, lambda: server.create_time_entries_bulk(entries))
+    assert len(results) == 4
+    assert results[0]["id"] == 10
+    assert results[1]["status_code"] == 422
+    assert results[1]["endpoint"] == "time_entries"
+    assert "invalid project" in results[1]["error"]
+    assert set(results[2]) == {"error"}
+    assert "unknown" in results[2]["error"]
+    assert results[3]["id"] == 40
+
+
+def test_bulk_create_caps_concurrent_requests():
+    limit = server.Config.BULK_CONCURRENCY
+    state = {"in_flight": 0, "max_in_flight": 0}
+    reached = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        if state["in_flight"] >= limit:
+            reached.set()
+        await release.wait()
+        state["in_flight"] -= 1
+        return httpx.Response(201, content=request.content)
+
+    entries = [{"project_id": i, "task_id": 1, "spent_date": "2026-01-01"} for i in range(limit * 2 + 1)]
+
+    async def scenario():
+        bulk = asyncio.create_task(server.create_time_entries_bulk(entries))
+        await asyncio.wait_for(reached.wait(), timeout=5)
+        # Give any requests beyond the cap a chance to reach the transport
+        # before the first batch is released.
+        for _ in range(100):
+            await asyncio.sleep(0)
+        release.set()
+        return await bulk
+
+    results = run_with_transport(handler, scenario)
+    assert [result["project_id"] for result in results] == list(range(len(entries)))
+    assert state["max_in_flight"] == limit